@@ -15,11 +15,17 @@ const { logActivity } = require('../utils/activity-tracker');
 // File Utilities
 // ============================================================================
 
+// Directories already confirmed this session. writeFileAtomically still does a
+// recursive mkdir, so a folder removed mid-session is recreated on write.
+const ensuredDirectories = new Set();
+
 /**
  * Ensure a directory exists, creating it if necessary
  * @param {string} dirPath - Path to directory
  */
 async function ensureDirectoryExists(dirPath) {
+  if (ensuredDirectories.has(dirPath)) return;
+
   try {
     await fs.access(dirPath);
   } catch (error) {
@@ -29,6 +35,8 @@ async function ensureDirectoryExists(dirPath) {
       throw error;
     }
   }
+
+  ensuredDirectories.add(dirPath);
 }
 
 /**